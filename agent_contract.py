@@ -8,7 +8,7 @@ import sys
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.fallbacks import get_fallback_config
+from src.fallbacks import get_fallback_config, get_timestamp
 
 config = get_fallback_config()
 
@@ -84,5 +84,4 @@ class AgentContract(ABC):
 
         :param message: Message to log
         """
-        from src.fallbacks import get_timestamp
         self.scratchpad.append(f"[{get_timestamp()}] {message}\n")
\ No newline at end of file
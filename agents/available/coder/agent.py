@@ -26,6 +26,9 @@ import re
 
 config = get_fallback_config()
 
+# Language identifiers accepted on the opening line of a code block
+CODE_BLOCK_LANGUAGES = frozenset({'python', 'dockerfile', 'yaml', 'json', 'bash', ''})
+
 # Load system prompt for coder agent
 def load_coder_prompt() -> str:
     """Load coder agent system prompt"""
@@ -59,8 +62,11 @@ class CoderAgent(AgentContract):
         feedback = task.get("feedback_from_tester", None)
 
         # Write initial status to scratchpad
-        self.scratchpad.append(f"[{get_timestamp()}] Coder Agent started (LLM-driven)\n")
-        self.scratchpad.append(f"[{get_timestamp()}] Task: {task_description}\n")
+        timestamp = get_timestamp()
+        self.scratchpad.append(
+            f"[{timestamp}] Coder Agent started (LLM-driven)\n"
+            f"[{timestamp}] Task: {task_description}\n"
+        )
 
         if feedback:
             self.scratchpad.append(f"[{get_timestamp()}] Feedback from tester: {feedback}\n")
@@ -122,8 +128,11 @@ Example:
             if produced_files:
                 self._send_api_spec_to_documenter(generated_content)
 
-            self.scratchpad.append(f"[{get_timestamp()}] Code generation completed\n")
-            self.scratchpad.append(f"[{get_timestamp()}] Generated {len(produced_files)} files\n")
+            timestamp = get_timestamp()
+            self.scratchpad.append(
+                f"[{timestamp}] Code generation completed\n"
+                f"[{timestamp}] Generated {len(produced_files)} files\n"
+            )
 
             return {
                 "status": "success",
@@ -167,7 +176,7 @@ Example:
 
             # First line might be language identifier
             first_line = lines[0].strip()
-            if first_line in ['python', 'dockerfile', 'yaml', 'json', 'bash', '']:
+            if first_line in CODE_BLOCK_LANGUAGES:
                 # Next line should be # filename
                 if len(lines) > 1 and lines[1].strip().startswith('#'):
                     filename = lines[1].strip()[1:].strip()
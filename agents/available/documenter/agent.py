@@ -24,6 +24,9 @@ from src.llm_client import create_llm_client_from_config
 
 config = get_fallback_config()
 
+# Language identifiers accepted on the opening line of a code block
+CODE_BLOCK_LANGUAGES = frozenset({'markdown', 'yaml', 'json', 'python', 'dockerfile', ''})
+
 # Load system prompt for documenter agent
 def load_documenter_prompt() -> str:
     """Load documenter agent system prompt"""
@@ -56,8 +59,11 @@ class DocumenterAgent(AgentContract):
         task_description = task.get("description", "")
 
         # Write initial status to scratchpad
-        self.scratchpad.append(f"[{get_timestamp()}] Documenter Agent started (LLM-driven)\n")
-        self.scratchpad.append(f"[{get_timestamp()}] Task: {task_description}\n")
+        timestamp = get_timestamp()
+        self.scratchpad.append(
+            f"[{timestamp}] Documenter Agent started (LLM-driven)\n"
+            f"[{timestamp}] Task: {task_description}\n"
+        )
 
         # Check for input from other agents via bridges
         bridge_context = ""
@@ -115,8 +121,11 @@ Example:
             if self.bridge_manager and produced_files:
                 self._send_doc_spec_to_coder()
 
-            self.scratchpad.append(f"[{get_timestamp()}] Documentation generation completed\n")
-            self.scratchpad.append(f"[{get_timestamp()}] Generated {len(produced_files)} documentation files\n")
+            timestamp = get_timestamp()
+            self.scratchpad.append(
+                f"[{timestamp}] Documentation generation completed\n"
+                f"[{timestamp}] Generated {len(produced_files)} documentation files\n"
+            )
 
             return {
                 "status": "success",
@@ -160,7 +169,7 @@ Example:
 
             # First line might be language identifier
             first_line = lines[0].strip()
-            if first_line in ['markdown', 'yaml', 'json', 'python', 'dockerfile', '']:
+            if first_line in CODE_BLOCK_LANGUAGES:
                 # Next line should be # filename
                 if len(lines) > 1 and lines[1].strip().startswith('#'):
                     filename = lines[1].strip()[1:].strip()
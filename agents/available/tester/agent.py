@@ -9,6 +9,7 @@ import time
 import subprocess
 import tempfile
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -22,6 +23,26 @@ from src.fallbacks import get_fallback_config, get_timestamp
 
 config = get_fallback_config()
 
+# File suffixes routed to the documentation and YAML validators
+DOCUMENTATION_SUFFIXES = frozenset({'.md', '.txt'})
+YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+
+# Criteria derived from the original request: a criterion applies when every keyword
+# of at least one of its groups appears in the lowercased request
+VALIDATION_CRITERIA_RULES = (
+    # Functional requirements
+    ("has_crud_endpoints", (("crud",), ("create",), ("manage",))),
+    ("has_fastapi_import", (("fastapi",),)),
+    ("has_dockerfile", (("docker",),)),
+    ("has_documentation", (("documentation",), ("readme",))),
+    # Technical requirements
+    ("uses_port_8000", (("port", "8000"),)),
+    ("no_auth_required", (("no authentication",), ("without auth",))),
+)
+
+# Any FastAPI route decorator counts as a CRUD endpoint; one alternation scans the file once
+CRUD_ENDPOINT_PATTERN = re.compile(r"@app\.(?:get|post|put|delete)")
+
 
 class TesterAgent(AgentContract):
     """
@@ -46,9 +67,12 @@ class TesterAgent(AgentContract):
         validation_level = task.get("context", {}).get("validation_level", "standard")
 
         # Write initial status to scratchpad
-        self.scratchpad.append(f"[{get_timestamp()}] Tester Agent started\n")
-        self.scratchpad.append(f"[{get_timestamp()}] Validating files: {produced_files}\n")
-        self.scratchpad.append(f"[{get_timestamp()}] Validation level: {validation_level}\n")
+        timestamp = get_timestamp()
+        self.scratchpad.append(
+            f"[{timestamp}] Tester Agent started\n"
+            f"[{timestamp}] Validating files: {produced_files}\n"
+            f"[{timestamp}] Validation level: {validation_level}\n"
+        )
         
         # Analyze original request to form validation criteria
         validation_criteria = self._form_validation_criteria(original_request, context_from_producers)
@@ -90,9 +114,11 @@ class TesterAgent(AgentContract):
         if issues:
             result["suggested_fixes"] = self._suggest_fixes(issues, produced_files)
         
-        self.scratchpad.append(f"[{get_timestamp()}] Validation completed. Quality score: {quality_score}\n")
+        timestamp = get_timestamp()
+        summary = f"[{timestamp}] Validation completed. Quality score: {quality_score}\n"
         if issues:
-            self.scratchpad.append(f"[{get_timestamp()}] Found {len(issues)} issues\n")
+            summary += f"[{timestamp}] Found {len(issues)} issues\n"
+        self.scratchpad.append(summary)
         
         return {
             "status": "failed" if issues else "success",
@@ -109,22 +135,10 @@ class TesterAgent(AgentContract):
         """
         criteria = {}
         request_lower = original_request.lower()
-        
-        # Functional requirements
-        if "crud" in request_lower or "create" in request_lower or "manage" in request_lower:
-            criteria["has_crud_endpoints"] = True
-        if "fastapi" in request_lower:
-            criteria["has_fastapi_import"] = True
-        if "docker" in request_lower:
-            criteria["has_dockerfile"] = True
-        if "documentation" in request_lower or "readme" in request_lower:
-            criteria["has_documentation"] = True
-        
-        # Technical requirements
-        if "port" in request_lower and "8000" in request_lower:
-            criteria["uses_port_8000"] = True
-        if "no authentication" in request_lower or "without auth" in request_lower:
-            criteria["no_auth_required"] = True
+
+        for criterion, keyword_groups in VALIDATION_CRITERIA_RULES:
+            if any(all(keyword in request_lower for keyword in group) for group in keyword_groups):
+                criteria[criterion] = True
         
         # Add any criteria from context
         criteria.update(context.get("validation_criteria", {}))
@@ -160,21 +174,24 @@ class TesterAgent(AgentContract):
             issues.append(f"File {file_path.name} is empty")
             return issues
         
+        # Path.suffix is recomputed on every access, so derive it once per file
+        suffix = file_path.suffix
+
         # Validate based on file extension
-        if file_path.suffix == '.py':
+        if suffix == '.py':
             issues.extend(self._validate_python_file(file_path, content, criteria, validation_level, allowed_tools))
         elif file_path.name.lower() == 'dockerfile':
             issues.extend(self._validate_dockerfile(file_path, content, criteria))
-        elif file_path.suffix in ['.md', '.txt']:
+        elif suffix in DOCUMENTATION_SUFFIXES:
             issues.extend(self._validate_documentation_file(file_path, content, criteria))
-        elif file_path.suffix in ['.yaml', '.yml']:
+        elif suffix in YAML_SUFFIXES:
             issues.extend(self._validate_yaml_file(file_path, content, criteria))
         
         # Check against specific criteria if they apply to this file
         if criteria.get("uses_port_8000") and "Dockerfile" in str(file_path):
             if "8000" not in content:
                 issues.append("Dockerfile does not expose port 8000")
-        elif criteria.get("has_fastapi_import") and file_path.suffix == ".py":
+        elif criteria.get("has_fastapi_import") and suffix == ".py":
             if "from fastapi" not in content and "import fastapi" not in content:
                 issues.append(f"Python file {file_path.name} does not contain FastAPI import")
         
@@ -226,9 +243,7 @@ class TesterAgent(AgentContract):
         
         # Check for basic CRUD operations if required
         if criteria.get("has_crud_endpoints"):
-            crud_patterns = ["@app.get", "@app.post", "@app.put", "@app.delete"]
-            has_crud = any(pattern in content for pattern in crud_patterns)
-            if not has_crud:
+            if not CRUD_ENDPOINT_PATTERN.search(content):
                 issues.append(f"Python file {file_path.name} does not contain CRUD endpoints")
         
         return issues
@@ -296,9 +311,10 @@ class TesterAgent(AgentContract):
         for issue in issues:
             # Determine which agent likely created the problematic file
             agent = "coder"
+            issue_lower = issue.lower()
             if "Dockerfile" in issue:
                 agent = "packager"
-            elif "documentation" in issue.lower() or "readme" in issue.lower():
+            elif "documentation" in issue_lower or "readme" in issue_lower:
                 agent = "documenter"
             
             fixes.append({
@@ -7,14 +7,15 @@ agent execution, result validation, and feedback loops.
 """
 # Standard library imports
 import argparse
+import copy
 import http.server
 import json
+import logging
 import os
 import socketserver
 import subprocess
 import sys
 import threading
-import time
 import urllib.parse
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -30,6 +31,14 @@ from src.fallbacks import get_fallback_config, get_timestamp
 from src.llm_client import create_llm_client_from_config
 
 config = get_fallback_config()
+logger = logging.getLogger(__name__)
+
+# Configuration used for agents without a readable agent.yaml. Each such agent gets its
+# own copy, so callers may modify it like a parsed config.
+DEFAULT_AGENT_CONFIG = {
+    "capabilities": ["basic"],
+    "accepts_bridges": False
+}
 
 # Load system prompts
 def load_prompt(prompt_name: str) -> str:
@@ -79,7 +88,10 @@ class MasterOrchestrator:
         self.running_agents = []
         self.status_monitor_thread = None
         self.monitoring = False
+        self._monitor_stop = threading.Event()  # Wakes the monitor loop as soon as monitoring stops
         self.agent_scratchpads = {}
+        self._status_tail_cache = {}  # scratchpad path -> ((inode, mtime_ns, size), tail lines)
+        self._agent_config_cache = {}  # agent.yaml path -> ((inode, mtime_ns, size), parsed config)
         self.bridge_manager = BridgeManager(workdir / "shared")
         self.llm_client = create_llm_client_from_config(config)
         self.master_prompt = load_prompt("master_orchestrator")
@@ -149,6 +161,7 @@ class MasterOrchestrator:
         Start the live status monitoring thread
         """
         self.monitoring = True
+        self._monitor_stop.clear()
         self.status_monitor_thread = threading.Thread(target=self._monitor_status_loop, daemon=True)
         self.status_monitor_thread.start()
     
@@ -157,6 +170,7 @@ class MasterOrchestrator:
         Stop the live status monitoring
         """
         self.monitoring = False
+        self._monitor_stop.set()
         if self.status_monitor_thread:
             self.status_monitor_thread.join(timeout=1)
     
@@ -169,7 +183,10 @@ class MasterOrchestrator:
 
         while self.monitoring:
             self._update_status_display()
-            time.sleep(refresh_interval)
+            # Wait on the stop event rather than sleeping, so stopping does not have to
+            # outlast a full refresh interval
+            if self._monitor_stop.wait(refresh_interval):
+                break
     
     def _update_status_display(self):
         """
@@ -188,59 +205,85 @@ class MasterOrchestrator:
         
         # Show master status
         master_scratchpad_path = self.workdir / "master.scratchpad.md"
-        if master_scratchpad_path.exists():
-            try:
-                with open(master_scratchpad_path, 'r', encoding='utf-8') as f:
-                    master_content = f.read()
-                    last_lines = master_content.split('\n')[-config.status_display_tail_lines:] if master_content else []
-                    print(f"[MASTER] Status: Active")
-                    for line in last_lines:
-                        if line.strip():
-                            print(f"         {line.strip()}")
-            except (IOError, PermissionError, UnicodeDecodeError) as e:
-                print(f"[MASTER] Status: Error reading scratchpad")
-        else:
-            print("[MASTER] Status: Initializing...")
+        try:
+            master_tail = self._read_status_tail(master_scratchpad_path)
+            if master_tail is None:
+                print("[MASTER] Status: Initializing...")
+            else:
+                print(f"[MASTER] Status: Active")
+                for line in master_tail:
+                    print(f"         {line}")
+        except (IOError, PermissionError, UnicodeDecodeError) as e:
+            print(f"[MASTER] Status: Error reading scratchpad")
         
-        # Show sub-agent status
-        for agent_name, scratchpad_path in self.agent_scratchpads.items():
+        # Show sub-agent status. Iterate over a snapshot: the main thread registers
+        # new scratchpads while this runs in the monitoring thread.
+        for agent_name, scratchpad_path in list(self.agent_scratchpads.items()):
             status_symbol = "[~]"  # Running
-            if scratchpad_path.exists():
-                try:
-                    with open(scratchpad_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        last_lines = content.split('\n')[-config.status_display_tail_lines:] if content else []
-                        
-                        print(f"[{agent_name.upper()}] {status_symbol}")
-                        for line in last_lines:
-                            if line.strip():
-                                print(f"         {line.strip()}")
-                except Exception:
-                    print(f"[{agent_name.upper()}] [?] Error reading status")
-            else:
-                print(f"[{agent_name.upper()}] [ ] Waiting to start...")
+            try:
+                tail = self._read_status_tail(scratchpad_path)
+                if tail is None:
+                    print(f"[{agent_name.upper()}] [ ] Waiting to start...")
+                else:
+                    print(f"[{agent_name.upper()}] {status_symbol}")
+                    for line in tail:
+                        print(f"         {line}")
+            except Exception:
+                print(f"[{agent_name.upper()}] [?] Error reading status")
         
         refresh_interval = config.status_refresh_seconds
         print("="*config.status_display_width)
         print(f"Live monitoring - refreshes every {refresh_interval} second(s) (Ctrl+C to interrupt)")
     
+    def _read_status_tail(self, scratchpad_path: Path) -> Optional[List[str]]:
+        """
+        Read the last non-empty lines of a scratchpad for the status display.
+
+        The tail is cached per file and only re-read when the file's inode, modification
+        time or size changes, so idle agents cost one stat() per refresh. The inode is
+        part of the key because Scratchpad.write replaces the file on every write, and a
+        capped scratchpad keeps the same size while coarse mtimes can repeat.
+
+        :param scratchpad_path: Path to the scratchpad file
+        :return: Stripped tail lines, or None if the scratchpad does not exist yet
+        :raises IOError: If the scratchpad cannot be read
+        :raises UnicodeDecodeError: If the scratchpad contains invalid UTF-8
+        """
+        try:
+            stat_result = scratchpad_path.stat()
+        except FileNotFoundError:
+            return None
+
+        signature = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._status_tail_cache.get(scratchpad_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(scratchpad_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        last_lines = content.split('\n')[-config.status_display_tail_lines:] if content else []
+        tail = [line.strip() for line in last_lines if line.strip()]
+
+        self._status_tail_cache[scratchpad_path] = (signature, tail)
+        return tail
+
     def setup_agent_bridges(self, subtasks: List[Dict]):
         """
         Set up bridges between compatible agents
         :param subtasks: List of subtasks to be executed
         """
-        # Find agents that accept bridges
+        # Find agents that accept bridges. An agent can own several subtasks, so
+        # deduplicate names (keeping order) before reading each config once.
         bridgeable_agents = []
-        for subtask in subtasks:
-            agent_name = subtask["agent"]
+        for agent_name in dict.fromkeys(subtask["agent"] for subtask in subtasks):
             agent_dir = project_root / "agents" / "available" / agent_name
             agent_config_path = agent_dir / "agent.yaml"
             
             if agent_config_path.exists():
                 try:
                     import yaml
-                    with open(agent_config_path, 'r', encoding='utf-8') as f:
-                        agent_cfg = yaml.safe_load(f)
+                    # Discovery has usually parsed this file already; reuse the cached config
+                    agent_cfg = self._load_agent_config(agent_config_path)
                     accepts_bridges = agent_cfg.get("accepts_bridges", False) if agent_cfg else False
                 except (IOError, PermissionError, yaml.YAMLError, ImportError) as e:
                     # If we can't read config, assume no bridges
@@ -296,59 +339,76 @@ class MasterOrchestrator:
         available_agents = []
 
         try:
-            agent_dirs = list(agents_dir.iterdir())
+            # DirEntry.is_dir() uses the type reported by readdir, avoiding a stat per entry
+            with os.scandir(agents_dir) as entries:
+                agent_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
         except (IOError, PermissionError) as e:
             # If we can't read agents directory, return empty list
-            import logging
-            logging.warning(f"Could not read agents directory {agents_dir}: {e}")
+            logger.warning(f"Could not read agents directory {agents_dir}: {e}")
             return available_agents
 
         for agent_dir in agent_dirs:
             try:
-                if not agent_dir.is_dir():
-                    continue
-
                 agent_config_path = agent_dir / "agent.yaml"
                 if agent_config_path.exists():
                     # Read agent configuration
                     try:
                         import yaml
-                        with open(agent_config_path, 'r', encoding='utf-8') as f:
-                            agent_cfg = yaml.safe_load(f)
+                        agent_cfg = self._load_agent_config(agent_config_path)
                         available_agents.append({
                             "name": agent_dir.name,
                             "path": agent_dir,
-                            "config": agent_cfg if agent_cfg else {"capabilities": ["basic"], "accepts_bridges": False}
+                            "config": agent_cfg if agent_cfg else copy.deepcopy(DEFAULT_AGENT_CONFIG)
                         })
                     except (IOError, PermissionError, yaml.YAMLError, ImportError) as e:
                         # If we can't read config, use defaults
-                        import logging
-                        logging.warning(f"Could not read config for agent {agent_dir.name}: {e}")
+                        logger.warning(f"Could not read config for agent {agent_dir.name}: {e}")
                         available_agents.append({
                             "name": agent_dir.name,
                             "path": agent_dir,
-                            "config": {
-                                "capabilities": ["basic"],
-                                "accepts_bridges": False
-                            }
+                            "config": copy.deepcopy(DEFAULT_AGENT_CONFIG)
                         })
                 else:
                     # Use default configuration if agent.yaml doesn't exist
                     available_agents.append({
                         "name": agent_dir.name,
                         "path": agent_dir,
-                        "config": {
-                            "capabilities": ["basic"],
-                            "accepts_bridges": False
-                        }
+                        "config": copy.deepcopy(DEFAULT_AGENT_CONFIG)
                     })
             except Exception as e:
                 # Skip agents we can't process
-                import logging
-                logging.warning(f"Error processing agent directory {agent_dir}: {e}")
+                logger.warning(f"Error processing agent directory {agent_dir}: {e}")
                 continue
 
         return available_agents
+
+    def _load_agent_config(self, agent_config_path: Path) -> Optional[Dict]:
+        """
+        Parse an agent's agent.yaml.
+
+        Discovery runs more than once per orchestration, so the parsed config is
+        cached per file and only re-parsed when its inode, modification time or size
+        changes, like the status-tail cache. Callers get a copy so the cache cannot be
+        modified through the returned config.
+
+        :param agent_config_path: Path to the agent.yaml file
+        :return: Parsed configuration (None for an empty file)
+        :raises IOError: If the file cannot be read
+        :raises yaml.YAMLError: If the file is not valid YAML
+        """
+        import yaml
+
+        stat_result = agent_config_path.stat()
+        signature = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._agent_config_cache.get(agent_config_path)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        with open(agent_config_path, 'r', encoding='utf-8') as f:
+            agent_cfg = yaml.safe_load(f)
+
+        self._agent_config_cache[agent_config_path] = (signature, agent_cfg)
+        return copy.deepcopy(agent_cfg)
     
     def run_agent(self, agent_name: str, task: Dict, scratchpad_path: Path,
                   allowed_tools: List[str] = None,
@@ -515,15 +575,18 @@ Remember: Output ONLY the JSON object, nothing else.
                 raise ValueError("LLM response missing required 'agents' field")
 
             # Convert LLM response to subtasks format
+            complexity = analysis.get('complexity', 5)
+            strategy = analysis.get('strategy', 'flat_delegation')
             subtasks = []
             for agent_spec in analysis.get('agents', []):
+                agent_name = agent_spec.get('name', 'echo')
                 subtasks.append({
-                    "agent": agent_spec.get('name', 'echo'),
+                    "agent": agent_name,
                     "description": agent_spec.get('subtask', task_description),
                     "context": {
-                        "type": agent_spec.get('name', 'echo'),
-                        "complexity": analysis.get('complexity', 5),
-                        "strategy": analysis.get('strategy', 'flat_delegation')
+                        "type": agent_name,
+                        "complexity": complexity,
+                        "strategy": strategy
                     },
                     "priority": agent_spec.get('priority', 1),
                     "tools": agent_spec.get('tools', config.allowed_tools)
@@ -539,8 +602,7 @@ Remember: Output ONLY the JSON object, nothing else.
 
         except Exception as e:
             # Fallback to simple decomposition if LLM fails
-            import logging
-            logging.warning(f"LLM decomposition failed: {e}. Using fallback.")
+            logger.warning(f"LLM decomposition failed: {e}. Using fallback.")
             return [{
                 "agent": "echo",
                 "description": task_description,
@@ -567,7 +629,7 @@ Remember: Output ONLY the JSON object, nothing else.
             validation = self._validate_results(task_description, results, workdir, master_scratchpad, clarification_endpoint)
 
             if not validation["passed"]:
-                results = self._handle_failures(validation, subtasks, workdir, master_scratchpad, clarification_endpoint, results)
+                results = self._handle_failures(task_description, validation, subtasks, workdir, master_scratchpad, clarification_endpoint, results)
 
             return self._finalize_results(task_description, subtasks, results, workdir, master_scratchpad)
         finally:
@@ -583,8 +645,12 @@ Remember: Output ONLY the JSON object, nothing else.
         """
         master_scratchpad_path = workdir / "master.scratchpad.md"
         master_scratchpad = Scratchpad(master_scratchpad_path)
-        master_scratchpad.append(f"[{get_timestamp()}] Master orchestrator started\n")
-        master_scratchpad.append(f"[{get_timestamp()}] Task: {task_description}\n")
+        # Each append rewrites the whole scratchpad, so write the startup lines in one batch
+        timestamp = get_timestamp()
+        master_scratchpad.append(
+            f"[{timestamp}] Master orchestrator started\n"
+            f"[{timestamp}] Task: {task_description}\n"
+        )
         return master_scratchpad
 
     def _start_services(self, master_scratchpad: Scratchpad) -> str:
@@ -682,12 +748,15 @@ Remember: Output ONLY the JSON object, nothing else.
         :param clarification_endpoint: Clarification endpoint URL
         :return: Validation result with 'passed' boolean and 'tester_result'
         """
+        # Collect produced files and check for any success in a single pass
         all_produced_files = []
+        tester_needed = False
         for result in results:
             if "produced_files" in result:
                 all_produced_files.extend(result["produced_files"])
+            if result['status'] == 'success':
+                tester_needed = True
 
-        tester_needed = len([r for r in results if r['status'] == 'success']) > 0
         if not tester_needed or not all_produced_files:
             return {"passed": True, "tester_result": None}
 
@@ -714,12 +783,13 @@ Remember: Output ONLY the JSON object, nothing else.
         passed = tester_result.get("status") != "failed"
         return {"passed": passed, "tester_result": tester_result}
 
-    def _handle_failures(self, validation: Dict, subtasks: List[Dict], workdir: Path,
-                        master_scratchpad: Scratchpad, clarification_endpoint: str,
+    def _handle_failures(self, task_description: str, validation: Dict, subtasks: List[Dict],
+                        workdir: Path, master_scratchpad: Scratchpad, clarification_endpoint: str,
                         results: List[Dict]) -> List[Dict]:
         """
         Handle tester failures by rerunning agents with feedback.
 
+        :param task_description: Original task description
         :param validation: Validation result from tester
         :param subtasks: Original subtasks
         :param workdir: Working directory
@@ -732,12 +802,22 @@ Remember: Output ONLY the JSON object, nothing else.
         issues = tester_result.get("result", {}).get("issues", [])
         suggested_fixes = tester_result.get("result", {}).get("suggested_fixes", [])
 
-        master_scratchpad.append(f"[{get_timestamp()}] Tester found {len(issues)} issues. Suggested fixes: {len(suggested_fixes)}\n")
-
+        # The tester suggests one fix per issue; group them so each agent is rerun once
+        # with all of its feedback rather than once per issue, where every rerun would
+        # overwrite the result of the previous one. The report lines share one timestamp
+        # and go out in a single append, since each append rewrites the scratchpad.
+        timestamp = get_timestamp()
+        report_lines = [f"[{timestamp}] Tester found {len(issues)} issues. Suggested fixes: {len(suggested_fixes)}\n"]
+        feedback_by_agent = {}
         for fix in suggested_fixes:
             agent_to_fix = fix.get('agent', 'unknown')
             suggestion = fix.get('suggestion', 'no details')
-            master_scratchpad.append(f"[{get_timestamp()}] Suggested fix for {agent_to_fix}: {suggestion}\n")
+            report_lines.append(f"[{timestamp}] Suggested fix for {agent_to_fix}: {suggestion}\n")
+            feedback_by_agent.setdefault(agent_to_fix, []).append(suggestion)
+        master_scratchpad.append("".join(report_lines))
+
+        for agent_to_fix, suggestions in feedback_by_agent.items():
+            feedback = "\n".join(suggestions)
 
             for subtask_index, subtask in enumerate(subtasks):
                 if subtask['agent'] == agent_to_fix:
@@ -746,7 +826,7 @@ Remember: Output ONLY the JSON object, nothing else.
                     updated_task = {
                         "description": subtask["description"],
                         "context": subtask["context"],
-                        "feedback_from_tester": suggestion
+                        "feedback_from_tester": feedback
                     }
 
                     rerun_scratchpad_path = workdir / f"{agent_to_fix}_rerun_{subtask_index}.scratchpad.md"
@@ -759,10 +839,9 @@ Remember: Output ONLY the JSON object, nothing else.
                         clarification_endpoint=clarification_endpoint
                     )
 
-                    for result_index, result in enumerate(results):
-                        if result_index < len(subtasks) and subtasks[result_index]["agent"] == agent_to_fix:
-                            results[result_index] = rerun_result
-                            break
+                    # _execute_subtasks returns one result per subtask in order, so the rerun
+                    # replaces its own slot
+                    results[subtask_index] = rerun_result
 
                     master_scratchpad.append(f"[{get_timestamp()}] Rerun of {agent_to_fix} completed with status: {rerun_result['status']}\n")
 
@@ -827,10 +906,14 @@ Remember: Output ONLY the JSON object, nothing else.
         """
         self.process_clarifications()
 
+        # Gather the summary counters in a single pass over the results
         all_produced_files = []
+        successful_count = 0
         for result in results:
             if "produced_files" in result:
                 all_produced_files.extend(result["produced_files"])
+            if result['status'] == 'success':
+                successful_count += 1
 
         master_scratchpad.append(f"[{get_timestamp()}] Orchestration completed\n")
 
@@ -840,7 +923,7 @@ Remember: Output ONLY the JSON object, nothing else.
         print("="*60)
         print(f"Task: {task_description}")
         print(f"Subtasks completed: {len(subtasks)}")
-        print(f"Successful results: {len([r for r in results if r['status'] == 'success'])}")
+        print(f"Successful results: {successful_count}")
         print(f"Files produced: {len(all_produced_files)}")
         if all_produced_files:
             print("Files:")
@@ -852,7 +935,7 @@ Remember: Output ONLY the JSON object, nothing else.
             "status": "success",
             "result": {
                 "subtask_results": results,
-                "summary": f"Processed {len(subtasks)} subtasks with {len([r for r in results if r['status'] == 'success'])} successful completions"
+                "summary": f"Processed {len(subtasks)} subtasks with {successful_count} successful completions"
             },
             "produced_files": all_produced_files
         }
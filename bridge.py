@@ -2,13 +2,17 @@
 Bridge/Messaging System for MSP agents
 Enables communication between agents via shared contexts
 """
+import glob
 import json
+import logging
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class Bridge:
     """
@@ -25,6 +29,9 @@ class Bridge:
         self.shared_dir = shared_dir / bridge_id
         self.shared_dir.mkdir(parents=True, exist_ok=True)
         self.lock = threading.Lock()
+        # Per-bridge sequence number keeps filenames unique and messages ordered when
+        # the clock is coarse
+        self._message_seq = 0
         
     def send_message(self, sender: str, message_type: str, data: Any):
         """
@@ -46,45 +53,81 @@ class Bridge:
         with self.lock:
             # Create a timestamped message file with microsecond precision
             timestamp = time.time()  # Float with microsecond precision
-            # Use timestamp in filename with microseconds to ensure uniqueness
+            # Timestamp keeps filenames readable; the sequence number tells apart messages
+            # that land in the same clock tick. The counter belongs to this Bridge instance,
+            # and every agent process builds its own BridgeManager, so it is only unique
+            # (and only orders messages) within one process.
+            self._message_seq += 1
             timestamp_str = f"{int(timestamp)}_{int((timestamp % 1) * 1000000)}"
-            msg_filename = f"{sender}_{message_type}_{timestamp_str}.json"
+            msg_filename = f"{sender}_{message_type}_{timestamp_str}_{self._message_seq}.json"
             msg_path = self.shared_dir / msg_filename
 
             message = {
                 "sender": sender,
                 "type": message_type,
                 "timestamp": timestamp,
+                "seq": self._message_seq,
                 "data": data
             }
 
+            # Write to a temp file and rename it into place so readers never see a
+            # partially written message (the .tmp suffix is not matched by get_messages)
+            temp_path = msg_path.with_suffix(msg_path.suffix + '.tmp')
+
             try:
-                with open(msg_path, 'w', encoding='utf-8') as f:
+                with open(temp_path, 'w', encoding='utf-8') as f:
                     json.dump(message, f, indent=2)
+                os.replace(temp_path, msg_path)
             except PermissionError as e:
+                self._discard_temp_file(temp_path)
                 # Re-raise PermissionError with context
                 raise PermissionError(f"Failed to send message to bridge {self.bridge_id}: {str(e)}")
             except (IOError, OSError) as e:
+                self._discard_temp_file(temp_path)
                 raise IOError(f"Failed to send message to bridge {self.bridge_id}: {str(e)}")
             except (TypeError, ValueError) as e:
+                self._discard_temp_file(temp_path)
                 raise ValueError(f"Failed to serialize message data: {str(e)}")
+
+    @staticmethod
+    def _discard_temp_file(temp_path: Path):
+        """
+        Remove a leftover temp file after a failed send, ignoring errors.
+        :param temp_path: Path of the temp file
+        """
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
     
     def get_messages(self, message_type: str = None, since: float = 0) -> list:
         """
         Get messages from the shared context.
 
-        :param message_type: Optional filter for message type
+        When filtering by type, only files named by send_message's scheme
+        (``<sender>_<type>_<timestamp>_<seq>.json``) are considered, since the type in
+        the filename is used to skip non-matching files without opening them.
+
+        :param message_type: Optional filter for message type (matched against the
+            filename as ``str(message_type)``, then against the stored type)
         :param since: Optional filter for messages after timestamp (exclusive)
-        :return: List of messages sorted by timestamp
+        :return: List of messages sorted by timestamp, then by sequence number
         """
         messages = []
 
+        # Filenames embed the message type, so only files that can match are opened.
+        # The pattern may also catch longer types containing this one; the type check
+        # on the parsed message below filters those out.
+        if message_type is None:
+            pattern = "*.json"
+        else:
+            pattern = f"*_{glob.escape(str(message_type))}_*.json"
+
         try:
-            msg_files = list(self.shared_dir.glob("*.json"))
+            msg_files = list(self.shared_dir.glob(pattern))
         except (IOError, PermissionError) as e:
             # If we can't read the directory, return empty list
-            import logging
-            logging.warning(f"Could not read bridge directory {self.shared_dir}: {e}")
+            logger.warning(f"Could not read bridge directory {self.shared_dir}: {e}")
             return messages
 
         for msg_file in msg_files:
@@ -94,8 +137,7 @@ class Bridge:
 
                 # Validate message structure
                 if not isinstance(msg, dict) or 'timestamp' not in msg or 'type' not in msg:
-                    import logging
-                    logging.warning(f"Malformed message file {msg_file}, skipping")
+                    logger.warning(f"Malformed message file {msg_file}, skipping")
                     continue
 
                 # Filter by timestamp (strictly greater than since)
@@ -104,23 +146,21 @@ class Bridge:
                         messages.append(msg)
             except (IOError, PermissionError, OSError) as e:
                 # Skip files we can't read
-                import logging
-                logging.warning(f"Could not read message file {msg_file}: {e}")
+                logger.warning(f"Could not read message file {msg_file}: {e}")
                 continue
             except (json.JSONDecodeError, ValueError) as e:
                 # Skip malformed JSON files
-                import logging
-                logging.warning(f"Malformed JSON in {msg_file}: {e}")
+                logger.warning(f"Malformed JSON in {msg_file}: {e}")
                 continue
             except (KeyError, TypeError) as e:
                 # Skip messages with missing fields
-                import logging
-                logging.warning(f"Invalid message structure in {msg_file}: {e}")
+                logger.warning(f"Invalid message structure in {msg_file}: {e}")
                 continue
 
-        # Sort by timestamp
+        # Sort by timestamp, breaking same-tick ties by sequence number (messages written
+        # before the sequence number was stored sort first within their tick)
         try:
-            messages.sort(key=lambda x: x['timestamp'])
+            messages.sort(key=lambda x: (x['timestamp'], x.get('seq', 0)))
         except (KeyError, TypeError):
             # If sorting fails, return unsorted
             pass
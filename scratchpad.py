@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 from pathlib import Path
@@ -10,6 +11,7 @@ sys.path.insert(0, str(project_root))
 from src.fallbacks import get_fallback_config
 
 config = get_fallback_config()
+logger = logging.getLogger(__name__)
 
 
 class Scratchpad:
@@ -63,15 +65,14 @@ class Scratchpad:
         if content is None:
             raise ValueError("Content cannot be None")
 
-        # Read existing content if appending
+        # Read existing content if appending (read() already handles a missing file)
         existing_content = ""
-        if self.scratchpad_path.exists() and append:
+        if append:
             try:
                 existing_content = self.read()
             except (IOError, UnicodeDecodeError) as e:
                 # If we can't read the existing file, log and start fresh
-                import logging
-                logging.warning(f"Could not read existing scratchpad, starting fresh: {e}")
+                logger.warning(f"Could not read existing scratchpad, starting fresh: {e}")
                 existing_content = ""
 
         # Combine content
@@ -95,7 +96,7 @@ class Scratchpad:
             if temp_path.exists():
                 try:
                     temp_path.unlink()
-                except:
+                except OSError:
                     pass
             raise type(e)(f"Failed to write scratchpad at {self.scratchpad_path}: {str(e)}")
 
@@ -107,7 +108,7 @@ class Scratchpad:
             if temp_path.exists():
                 try:
                     temp_path.unlink()
-                except:
+                except OSError:
                     pass
             raise type(e)(f"Failed to finalize scratchpad write at {self.scratchpad_path}: {str(e)}")
     
@@ -6,11 +6,15 @@ Supports OpenAI, Anthropic, Ollama, Subprocess CLI tools, and Mock for testing.
 Provides unified API for all agents to generate intelligent responses.
 """
 import json
+import logging
 import os
 import re
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -161,11 +165,6 @@ class SubprocessLLMProvider(LLMProvider):
         :param max_tokens: Maximum tokens to generate
         :return: Content of the file created by qwen
         """
-        import logging
-        import tempfile
-        from pathlib import Path
-        logger = logging.getLogger(__name__)
-
         try:
             # УПРОЩЕННЫЙ подход: qwen возвращает JSON в stdout
             # НЕ просим создать файл - это усложняет промпт
@@ -185,7 +184,7 @@ Respond with ONLY valid JSON. No explanations, no markdown, just JSON."""
                 "--approval-mode", "yolo"
             ]
 
-            logger.info(f"[SubprocessLLM/qwen] Starting qwen")
+            logger.info("[SubprocessLLM/qwen] Starting qwen")
 
             # Execute qwen from project root
             proc = self.subprocess.Popen(
@@ -201,14 +200,14 @@ Respond with ONLY valid JSON. No explanations, no markdown, just JSON."""
             # Wait for qwen to finish
             stdout, stderr = proc.communicate(timeout=self.timeout)
 
-            logger.info(f"[SubprocessLLM/qwen] stdout length: {len(stdout)} chars")
-            logger.info(f"[SubprocessLLM/qwen] First 500 chars of stdout:\n{stdout[:500]}")
+            logger.info("[SubprocessLLM/qwen] stdout length: %s chars", len(stdout))
+            logger.info("[SubprocessLLM/qwen] First 500 chars of stdout:\n%s", stdout[:500])
             if stderr:
-                logger.debug(f"[SubprocessLLM/qwen] stderr: {stderr[:500]}")
+                logger.debug("[SubprocessLLM/qwen] stderr: %s", stderr[:500])
 
             # Parse stdout directly
             if stdout:
-                logger.info(f"[SubprocessLLM/qwen] ✅ Got response, returning to parser")
+                logger.info("[SubprocessLLM/qwen] ✅ Got response, returning to parser")
                 return stdout.strip()
             else:
                 raise RuntimeError(f"qwen returned no output (stderr: {stderr[:200]})")
@@ -501,10 +500,7 @@ class LLMClient:
         Extract and parse JSON from LLM response with robust parsing.
         Handles code blocks, plain JSON, and extra text around JSON.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
-        logger.debug(f"[JSONParser] Parsing response of length {len(response)}")
+        logger.debug("[JSONParser] Parsing response of length %s", len(response))
 
         # Strategy 1: Try code blocks with balanced braces
         code_block_patterns = [
@@ -518,7 +514,7 @@ class LLMClient:
                 json_str = match.group(1)
                 try:
                     parsed = json.loads(json_str)
-                    logger.debug(f"[JSONParser] Successfully parsed from code block")
+                    logger.debug("[JSONParser] Successfully parsed from code block")
                     return parsed
                 except json.JSONDecodeError:
                     continue
@@ -539,7 +535,7 @@ class LLMClient:
                     potential_jsons.append(response[start_idx:i+1])
                     start_idx = None
 
-        logger.debug(f"[JSONParser] Found {len(potential_jsons)} potential JSON objects")
+        logger.debug("[JSONParser] Found %s potential JSON objects", len(potential_jsons))
 
         # Strategy 3: Try parsing each potential JSON, prefer ones with 'agents' field
         candidates = []
@@ -556,7 +552,9 @@ class LLMClient:
                     if 'strategy' in parsed:
                         score += 10
                     candidates.append((score, parsed))
-                    logger.debug(f"[JSONParser] Valid JSON found (score: {score}, keys: {list(parsed.keys())})")
+                    # Only build the key list when the record will actually be emitted
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[JSONParser] Valid JSON found (score: %s, keys: %s)", score, list(parsed))
             except json.JSONDecodeError:
                 continue
 
@@ -564,20 +562,20 @@ class LLMClient:
         if candidates:
             candidates.sort(key=lambda x: x[0], reverse=True)
             best_score, best_json = candidates[0]
-            logger.info(f"[JSONParser] Selected JSON with score {best_score}")
+            logger.info("[JSONParser] Selected JSON with score %s", best_score)
             return best_json
 
         # Strategy 4: Try parsing entire response as JSON
         try:
             parsed = json.loads(response.strip())
-            logger.debug(f"[JSONParser] Parsed entire response as JSON")
+            logger.debug("[JSONParser] Parsed entire response as JSON")
             return parsed
         except json.JSONDecodeError:
             pass
 
         # Fallback: return error structure
-        logger.warning(f"[JSONParser] Failed to extract valid JSON from response")
-        logger.debug(f"[JSONParser] Raw response:\n{response[:500]}")
+        logger.warning("[JSONParser] Failed to extract valid JSON from response")
+        logger.debug("[JSONParser] Raw response:\n%s", response[:500])
         return {
             "error": "Failed to parse JSON from LLM response",
             "raw_response": response[:1000]  # Truncate for logging
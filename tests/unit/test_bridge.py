@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import time
 from pathlib import Path
+from unittest.mock import patch
 import sys
 
 # Add project root to path
@@ -83,6 +84,20 @@ class TestBridgeSendMessage:
             json_files = list(bridge_dir.glob("*.json"))
             assert len(json_files) == 3
 
+    def test_send_messages_in_same_tick_are_not_overwritten(self):
+        """Test back-to-back messages get distinct files even without a delay"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shared_dir = Path(tmpdir)
+            bridge = Bridge("test_bridge", shared_dir)
+
+            with patch('bridge.time.time', return_value=1000.5):
+                for i in range(20):
+                    bridge.send_message("agent1", "type1", {"msg": i})
+
+            bridge_dir = shared_dir / "test_bridge"
+            json_files = list(bridge_dir.glob("*.json"))
+            assert len(json_files) == 20
+
 
 class TestBridgeGetMessages:
     """Test Bridge get_messages functionality"""
@@ -116,6 +131,32 @@ class TestBridgeGetMessages:
             assert len(messages) == 2
             assert all(msg["type"] == "typeA" for msg in messages)
 
+    def test_get_messages_filter_does_not_match_longer_types(self):
+        """Test filtering by a type does not return types that contain it"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shared_dir = Path(tmpdir)
+            bridge = Bridge("test_bridge", shared_dir)
+
+            bridge.send_message("coder", "api_specification", {"msg": 1})
+            bridge.send_message("coder", "specification", {"msg": 2})
+
+            messages = bridge.get_messages(message_type="specification")
+            assert len(messages) == 1
+            assert messages[0]["data"] == {"msg": 2}
+
+    def test_get_messages_filter_accepts_non_string_type(self):
+        """Test a non-string type filter is matched rather than raising"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shared_dir = Path(tmpdir)
+            bridge = Bridge("test_bridge", shared_dir)
+
+            bridge.send_message("coder", 2, {"msg": 1})
+            bridge.send_message("coder", "specification", {"msg": 2})
+
+            messages = bridge.get_messages(message_type=2)
+            assert len(messages) == 1
+            assert messages[0]["data"] == {"msg": 1}
+
     def test_get_messages_sorted_by_timestamp(self):
         """Test get_messages returns messages sorted by timestamp"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -161,6 +202,20 @@ class TestBridgeGetMessages:
             messages = bridge.get_messages()
             assert messages == []
 
+    def test_get_messages_orders_same_tick_messages_by_sequence(self):
+        """Test messages sharing a timestamp come back in the order they were sent"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shared_dir = Path(tmpdir)
+            bridge = Bridge("test_bridge", shared_dir)
+
+            with patch('bridge.time.time', return_value=1000.5):
+                for i in range(20):
+                    bridge.send_message("agent1", "type1", {"msg": i})
+
+            messages = bridge.get_messages()
+            assert [msg["data"]["msg"] for msg in messages] == list(range(20))
+            assert bridge.get_latest_message("type1")["data"]["msg"] == 19
+
 
 class TestBridgeGetLatestMessage:
     """Test Bridge get_latest_message functionality"""
@@ -385,6 +385,18 @@ class TestResourceCleanup:
             # Directory and files should exist
             assert (shared_dir / "test_bridge").exists()
 
+    def test_bridge_failed_send_leaves_no_files(self):
+        """Test a message that cannot be serialized leaves no partial or temp files"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shared_dir = Path(tmpdir)
+            bridge = Bridge("test_bridge", shared_dir)
+
+            with pytest.raises(ValueError):
+                bridge.send_message("agent1", "test", {"data": object()})
+
+            assert list((shared_dir / "test_bridge").iterdir()) == []
+            assert bridge.get_messages() == []
+
 
 class TestConcurrentOperations:
     """Test concurrent operation error handling"""
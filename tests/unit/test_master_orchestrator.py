@@ -5,6 +5,7 @@ Unit tests for MasterOrchestrator class
 import pytest
 import tempfile
 import json
+import os
 from pathlib import Path
 import sys
 from unittest.mock import Mock, patch, MagicMock
@@ -14,7 +15,8 @@ import subprocess
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from agents.master.master import MasterOrchestrator
+from agents.master.master import DEFAULT_AGENT_CONFIG, MasterOrchestrator
+from scratchpad import Scratchpad
 
 
 class TestMasterOrchestratorInit:
@@ -246,6 +248,55 @@ class TestAgentDiscovery:
                 assert "path" in agent
                 assert "config" in agent
 
+    def test_find_available_agents_gives_each_agent_its_own_default_config(self):
+        """Test agents without a config get separate copies of the default config"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+
+            with patch.object(orchestrator, '_load_agent_config', return_value=None):
+                agents = orchestrator.find_available_agents()
+
+            assert len(agents) >= 2
+            assert all(agent["config"] == DEFAULT_AGENT_CONFIG for agent in agents)
+            agents[0]["config"]["capabilities"].append("coding")
+            assert agents[1]["config"] == DEFAULT_AGENT_CONFIG
+            assert DEFAULT_AGENT_CONFIG == {"capabilities": ["basic"], "accepts_bridges": False}
+
+    def test_load_agent_config_reparses_only_when_file_changes(self):
+        """Test the parsed agent.yaml is reused until the file changes"""
+        import yaml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+            config_path = workdir / "agent.yaml"
+            config_path.write_text("capabilities: [coding]\n", encoding='utf-8')
+
+            with patch('yaml.safe_load', wraps=yaml.safe_load) as mock_safe_load:
+                first = orchestrator._load_agent_config(config_path)
+                assert first == {"capabilities": ["coding"]}
+                assert orchestrator._load_agent_config(config_path) == first
+            assert mock_safe_load.call_count == 1
+
+            config_path.write_text("capabilities: [coding, testing]\n", encoding='utf-8')
+
+            assert orchestrator._load_agent_config(config_path) == {"capabilities": ["coding", "testing"]}
+
+    def test_load_agent_config_returns_copy_of_cached_config(self):
+        """Test changes to a returned config do not leak into the cache"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+            config_path = workdir / "agent.yaml"
+            config_path.write_text("capabilities: [coding]\n", encoding='utf-8')
+
+            first = orchestrator._load_agent_config(config_path)
+            first["capabilities"].append("testing")
+            first["accepts_bridges"] = True
+
+            assert orchestrator._load_agent_config(config_path) == {"capabilities": ["coding"]}
+
 
 class TestRunAgent:
     """Test run_agent functionality"""
@@ -414,6 +465,65 @@ class TestClarificationHandling:
             orchestrator.process_clarifications()
 
 
+class TestStatusDisplay:
+    """Test scratchpad tail reading for the live status display"""
+
+    def test_read_status_tail_missing_file_returns_none(self):
+        """Test a scratchpad that does not exist yet reports None"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+
+            assert orchestrator._read_status_tail(workdir / "missing.scratchpad.md") is None
+
+    def test_read_status_tail_rereads_only_when_file_changes(self):
+        """Test the cached tail is reused until the scratchpad changes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+            scratchpad_path = workdir / "coder_0.scratchpad.md"
+            scratchpad_path.write_text("line one\nline two\n", encoding='utf-8')
+
+            first = orchestrator._read_status_tail(scratchpad_path)
+            assert first[-1] == "line two"
+            assert orchestrator._read_status_tail(scratchpad_path) is first
+
+            scratchpad_path.write_text("line one\nline two\nline three is longer\n", encoding='utf-8')
+
+            assert orchestrator._read_status_tail(scratchpad_path)[-1] == "line three is longer"
+
+    def test_read_status_tail_rereads_capped_scratchpad_with_same_mtime(self):
+        """Test a replaced scratchpad with unchanged size and mtime is still re-read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+            scratchpad_path = workdir / "coder_0.scratchpad.md"
+            scratchpad = Scratchpad(scratchpad_path, max_chars=20)
+
+            scratchpad.write("x" * 20 + "first line\n", append=False)
+            size = scratchpad_path.stat().st_size
+            os.utime(scratchpad_path, ns=(1_000_000_000, 1_000_000_000))
+            assert orchestrator._read_status_tail(scratchpad_path)[-1].endswith("first line")
+
+            scratchpad.write("second line\n")
+            os.utime(scratchpad_path, ns=(1_000_000_000, 1_000_000_000))
+            assert scratchpad_path.stat().st_size == size
+
+            assert orchestrator._read_status_tail(scratchpad_path)[-1].endswith("second line")
+
+    def test_stop_status_monitoring_interrupts_refresh_wait(self):
+        """Test stopping the monitor does not wait out the refresh interval"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+
+            with patch.object(orchestrator, '_update_status_display'):
+                orchestrator.start_status_monitoring()
+                orchestrator.stop_status_monitoring()
+
+            assert not orchestrator.status_monitor_thread.is_alive()
+
+
 class TestBridgeSetup:
     """Test bridge setup between agents"""
 
@@ -439,6 +549,101 @@ capabilities: ["coding"]
             # Should not raise error
             orchestrator.setup_agent_bridges(subtasks)
 
+    def test_setup_agent_bridges_skips_duplicate_agents(self):
+        """Test an agent owning several subtasks gets no bridge to itself"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+
+            subtasks = [
+                {"agent": "coder", "description": "Code task"},
+                {"agent": "coder", "description": "More code"},
+                {"agent": "documenter", "description": "Doc task"}
+            ]
+
+            orchestrator.setup_agent_bridges(subtasks)
+
+            assert orchestrator.bridge_manager.list_bridges() == ["coder_to_documenter"]
+
+    def test_setup_agent_bridges_reuses_configs_parsed_by_discovery(self):
+        """Test bridge setup does not re-parse agent.yaml files discovery already read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+            orchestrator.find_available_agents()
+
+            subtasks = [
+                {"agent": "coder", "description": "Code task"},
+                {"agent": "documenter", "description": "Doc task"}
+            ]
+
+            with patch('yaml.safe_load') as mock_safe_load:
+                orchestrator.setup_agent_bridges(subtasks)
+
+            mock_safe_load.assert_not_called()
+            assert orchestrator.bridge_manager.list_bridges() == ["coder_to_documenter"]
+
+
+class TestHandleFailures:
+    """Test rerunning agents with tester feedback"""
+
+    def test_handle_failures_reruns_each_owned_subtask_once_into_its_own_slot(self):
+        """Test each agent is rerun once per owned subtask with all its feedback joined"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            orchestrator = MasterOrchestrator(workdir)
+            master_scratchpad = Scratchpad(workdir / "master.scratchpad.md")
+
+            subtasks = [
+                {"agent": "coder", "description": "Code task", "context": {}},
+                {"agent": "coder", "description": "More code", "context": {}},
+                {"agent": "documenter", "description": "Doc task", "context": {}}
+            ]
+            results = [{"status": "success", "produced_files": [f"original_{i}.py"]} for i in range(3)]
+            validation = {
+                "passed": False,
+                "tester_result": {
+                    "status": "failed",
+                    "result": {
+                        "issues": ["missing route", "no tests", "stale readme"],
+                        "suggested_fixes": [
+                            {"agent": "coder", "suggestion": "Add the route"},
+                            {"agent": "documenter", "suggestion": "Update the README"},
+                            {"agent": "coder", "suggestion": "Add tests"}
+                        ]
+                    }
+                }
+            }
+
+            def fake_run_agent(agent_name, task, scratchpad_path, **kwargs):
+                return {
+                    "status": "success",
+                    "agent": agent_name,
+                    "scratchpad": scratchpad_path.name,
+                    "produced_files": [f"{scratchpad_path.stem}.py"]
+                }
+
+            with patch.object(orchestrator, 'run_agent', side_effect=fake_run_agent) as mock_run_agent:
+                updated = orchestrator._handle_failures(
+                    "Build an API", validation, subtasks, workdir,
+                    master_scratchpad, None, results
+                )
+
+            rerun_calls = [c for c in mock_run_agent.call_args_list if c.kwargs["agent_name"] != "tester"]
+            assert [c.kwargs["agent_name"] for c in rerun_calls] == ["coder", "coder", "documenter"]
+            assert [c.kwargs["task"]["description"] for c in rerun_calls] == ["Code task", "More code", "Doc task"]
+            assert rerun_calls[0].kwargs["task"]["feedback_from_tester"] == "Add the route\nAdd tests"
+            assert rerun_calls[1].kwargs["task"]["feedback_from_tester"] == "Add the route\nAdd tests"
+            assert rerun_calls[2].kwargs["task"]["feedback_from_tester"] == "Update the README"
+
+            assert [r["scratchpad"] for r in updated[:3]] == [
+                "coder_rerun_0.scratchpad.md",
+                "coder_rerun_1.scratchpad.md",
+                "documenter_rerun_2.scratchpad.md"
+            ]
+            assert updated[3]["agent"] == "tester"
+            assert mock_run_agent.call_args_list[-1].kwargs["task"]["description"] == "Build an API"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -198,6 +198,46 @@ class TestTesterAgentValidation:
             # Should fail because FastAPI import is missing
             assert result["status"] == "failed"
 
+    def test_execute_detects_crud_endpoints(self):
+        """Test execute accepts any FastAPI route decorator as a CRUD endpoint"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scratchpad_path = Path(tmpdir) / "tester.scratchpad.md"
+            agent = TesterAgent(scratchpad_path)
+
+            py_file = Path(tmpdir) / "main.py"
+            py_file.write_text("from fastapi import FastAPI\napp = FastAPI()\n\n@app.delete('/items/{id}')\ndef remove(id: int):\n    return id\n")
+
+            task = {
+                "description": "Create a CRUD service",
+                "produced_files": [str(py_file)],
+                "context_from_producers": {},
+                "context": {}
+            }
+
+            result = agent.execute(task, ["file_read"])
+
+            assert result["status"] == "success"
+
+    def test_execute_fails_missing_crud_endpoints(self):
+        """Test execute fails when CRUD endpoints are required but missing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scratchpad_path = Path(tmpdir) / "tester.scratchpad.md"
+            agent = TesterAgent(scratchpad_path)
+
+            py_file = Path(tmpdir) / "main.py"
+            py_file.write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+
+            task = {
+                "description": "Create a CRUD service",
+                "produced_files": [str(py_file)],
+                "context_from_producers": {},
+                "context": {}
+            }
+
+            result = agent.execute(task, ["file_read"])
+
+            assert result["status"] == "failed"
+
     def test_execute_writes_to_scratchpad(self):
         """Test execute writes to scratchpad"""
         with tempfile.TemporaryDirectory() as tmpdir: